@@ -15,7 +15,6 @@ from typing import TYPE_CHECKING, Any, Union, cast
 
 from spdx_python_model.bindings import v3_0_1 as spdx3
 from spdx_tools.spdx.model.relationship import RelationshipType
-from spdx_tools.spdx.model.spdx_no_assertion import SpdxNoAssertion
 from spdx_tools.spdx.parser import parse_anything
 from spdx_tools.spdx.parser.error import SPDXParsingError
 from spdx_tools.spdx.validation.document_validator import validate_full_spdx_document
@@ -32,6 +31,7 @@ from .report import (
     report_html,
     report_text,
 )
+from .spdx2_utils import scan_packages
 from .spdx3_utils import (
     has_package_dependency_relationship,
     iter_objects_with_property,
@@ -219,18 +219,17 @@ class BaseChecker(ABC):
             self.doc_timestamp = self.check_timestamp()
             self.dependency_relationships = self.check_dependency_relationships()
 
-            self.components_without_names = self.get_components_without_names()
-            self.components_without_versions = self.get_components_without_versions()
-            self.components_without_suppliers = self.get_components_without_suppliers()
-            self.components_without_identifiers = (
-                self.get_components_without_identifiers()
-            )
-            self.components_without_concluded_licenses = (
-                self.get_components_without_concluded_licenses()
-            )
-            self.components_without_copyright_texts = (
-                self.get_components_without_copyright_texts()
-            )
+            components_without_info = self._find_components_without_info()
+            self.components_without_names = components_without_info["name"]
+            self.components_without_versions = components_without_info["version"]
+            self.components_without_suppliers = components_without_info["supplier"]
+            self.components_without_identifiers = components_without_info["identifier"]
+            self.components_without_concluded_licenses = components_without_info[
+                "concluded_license"
+            ]
+            self.components_without_copyright_texts = components_without_info[
+                "copyright_text"
+            ]
 
             # List of (info_name, components) tuples,
             # where components is a list of (component_name, spdx_id) tuples
@@ -290,23 +289,18 @@ class BaseChecker(ABC):
             if not self.doc.relationships:
                 return False
 
-            describes_relationships = [
-                rel
-                for rel in self.doc.relationships
-                if rel.relationship_type == RelationshipType.DESCRIBES
-            ]
-
             # A set of all package spdx_ids for quick lookup
             spdx_id_set = {package.spdx_id for package in self.doc.packages}
 
-            # Check if any of the "DESCRIBES" relationships describe a Package
-            describes_package = any(
-                rel.related_spdx_element_id in spdx_id_set
-                for rel in describes_relationships
+            # Check if any of the "DESCRIBES" relationships describe a Package.
+            # Iterate lazily, so the scan stops at the first match without
+            # building an intermediate list of DESCRIBES relationships.
+            return any(
+                rel.relationship_type == RelationshipType.DESCRIBES
+                and rel.related_spdx_element_id in spdx_id_set
+                for rel in self.doc.relationships
             )
 
-            return describes_package
-
         # SPDX 3
         if self.sbom_spec == "spdx3":
             self.doc = cast("spdx3.SHACLObjectSet", self.doc)
@@ -445,22 +439,7 @@ class BaseChecker(ABC):
 
         # SPDX 2
         if self.sbom_spec == "spdx2":
-            self.doc = cast("Document", self.doc)
-            packages = getattr(self.doc, "packages", [])
-
-            return [
-                (package.name or "", package.spdx_id or "")
-                for package in packages
-                if package.spdx_id in self.reachable_component_ids
-                and (
-                    package.license_concluded is None
-                    or isinstance(package.license_concluded, SpdxNoAssertion)
-                    or (
-                        isinstance(package.license_concluded, str)
-                        and package.license_concluded.strip() == ""
-                    )
-                )
-            ]
+            return self._get_spdx2_components_without("concluded_license")
 
         # SPDX 3
         if self.sbom_spec == "spdx3":
@@ -512,22 +491,7 @@ class BaseChecker(ABC):
 
         # SPDX 2
         if self.sbom_spec == "spdx2":
-            self.doc = cast("Document", self.doc)
-            packages = getattr(self.doc, "packages", [])
-
-            return [
-                (package.name or "", package.spdx_id or "")
-                for package in packages
-                if package.spdx_id in self.reachable_component_ids
-                and (
-                    package.copyright_text is None
-                    or isinstance(package.copyright_text, SpdxNoAssertion)
-                    or (
-                        isinstance(package.copyright_text, str)
-                        and package.copyright_text.strip() == ""
-                    )
-                )
-            ]
+            return self._get_spdx2_components_without("copyright_text")
 
         # SPDX 3
         if self.sbom_spec == "spdx3":
@@ -566,21 +530,7 @@ class BaseChecker(ABC):
 
         # SPDX 2
         if self.sbom_spec == "spdx2":
-            self.doc = cast("Document", self.doc)
-            packages = getattr(self.doc, "packages", [])
-
-            return [
-                (package.name or "", package.spdx_id or "")
-                for package in packages
-                if package.spdx_id in self.reachable_component_ids
-                and (
-                    package.spdx_id is None
-                    or (
-                        isinstance(package.spdx_id, str)
-                        and package.spdx_id.strip() == ""
-                    )
-                )
-            ]
+            return self._get_spdx2_components_without("identifier")
 
         # SPDX 3
         if self.sbom_spec == "spdx3":
@@ -610,18 +560,7 @@ class BaseChecker(ABC):
 
         # SPDX 2
         if self.sbom_spec == "spdx2":
-            self.doc = cast("Document", self.doc)
-            packages = getattr(self.doc, "packages", [])
-
-            return [
-                (package.name or "", package.spdx_id or "")
-                for package in packages
-                if package.spdx_id in self.reachable_component_ids
-                and (
-                    package.name is None
-                    or (isinstance(package.name, str) and package.name.strip() == "")
-                )
-            ]
+            return self._get_spdx2_components_without("name")
 
         # SPDX 3
         if self.sbom_spec == "spdx3":
@@ -654,22 +593,7 @@ class BaseChecker(ABC):
 
         # SPDX 2
         if self.sbom_spec == "spdx2":
-            self.doc = cast("Document", self.doc)
-            packages = getattr(self.doc, "packages", [])
-
-            return [
-                (package.name or "", package.spdx_id or "")
-                for package in packages
-                if package.spdx_id in self.reachable_component_ids
-                and (
-                    package.supplier is None
-                    or isinstance(package.supplier, SpdxNoAssertion)
-                    or (
-                        isinstance(package.supplier, str)
-                        and package.supplier.strip() == ""
-                    )
-                )
-            ]
+            return self._get_spdx2_components_without("supplier")
 
         # SPDX 3
         if self.sbom_spec == "spdx3":
@@ -706,22 +630,7 @@ class BaseChecker(ABC):
 
         # SPDX 2
         if self.sbom_spec == "spdx2":
-            self.doc = cast("Document", self.doc)
-            packages = getattr(self.doc, "packages", [])
-
-            return [
-                (package.name or "", package.spdx_id or "")
-                for package in packages
-                if package.spdx_id in self.reachable_component_ids
-                and (
-                    package.version is None
-                    or isinstance(package.version, SpdxNoAssertion)
-                    or (
-                        isinstance(package.version, str)
-                        and package.version.strip() == ""
-                    )
-                )
-            ]
+            return self._get_spdx2_components_without("version")
 
         # SPDX 3
         if self.sbom_spec == "spdx3":
@@ -741,6 +650,46 @@ class BaseChecker(ABC):
 
         return []
 
+    def _get_spdx2_components_without(self, info_name: str) -> list[tuple[str, str]]:
+        """
+        Retrieve reachable SPDX 2 packages missing one piece of information.
+
+        Args:
+            info_name (str): The information to check, e.g. "name".
+                See spdx2_utils.SPDX2_COMPONENT_INFO.
+
+        Returns:
+            list[tuple[str, str]]: A list of (component_name, spdx_id) tuples.
+        """
+        packages = getattr(self.doc, "packages", None)
+        return scan_packages(packages, self.reachable_component_ids, (info_name,))[
+            info_name
+        ]
+
+    def _find_components_without_info(self) -> dict[str, list[tuple[str, str]]]:
+        """
+        Find components missing each piece of required information.
+
+        For SPDX 2, all the information is collected in a single pass over
+        the packages instead of one pass per get_components_without_* method.
+
+        Returns:
+            dict[str, list[tuple[str, str]]]: A mapping from information name
+            to a list of (component_name, spdx_id) tuples.
+        """
+        if self.sbom_spec == "spdx2":
+            packages = getattr(self.doc, "packages", None)
+            return scan_packages(packages, self.reachable_component_ids)
+
+        return {
+            "name": self.get_components_without_names(),
+            "version": self.get_components_without_versions(),
+            "identifier": self.get_components_without_identifiers(),
+            "supplier": self.get_components_without_suppliers(),
+            "concluded_license": self.get_components_without_concluded_licenses(),
+            "copyright_text": self.get_components_without_copyright_texts(),
+        }
+
     def _get_all_components_without_info(
         self,
     ) -> list[tuple[str, list[tuple[str, str]]]]:
@@ -785,6 +734,25 @@ class BaseChecker(ABC):
 
         return 0
 
+    def _check_regular_file(self) -> bool:
+        """
+        Check that the input file exists and is a regular file.
+
+        Records a parsing error if it is not.
+
+        Returns:
+            bool: True if the file is a regular file, otherwise False.
+        """
+        if os.path.isfile(self.file):
+            return True
+        if os.path.exists(self.file):
+            message = f"Not a regular file: {self.file}"
+        else:
+            message = f"File not found: {self.file}"
+        logging.error("%s", message)
+        self._parsing_errors.append(message)
+        return False
+
     def parse_file(self) -> Document | None:
         """
         Parse SPDX 2 SBOM document.
@@ -796,8 +764,8 @@ class BaseChecker(ABC):
             logging.error("No file path provided.")
             return None
 
-        if not os.path.exists(self.file):
-            logging.error("File not found: %s", self.file)
+        # Check up front instead of letting the parser raise and unwind
+        if not self._check_regular_file():
             return None
 
         try:
@@ -835,8 +803,14 @@ class BaseChecker(ABC):
             logging.error("No file path provided.")
             return None
 
-        if not os.path.exists(self.file):
-            logging.error("File not found: %s", self.file)
+        # Check up front instead of letting the parser raise and unwind
+        if not self._check_regular_file():
+            return None
+
+        # Nothing to deserialize; skip the JSON-LD reader entirely
+        if os.path.getsize(self.file) == 0:
+            logging.error("File is empty: %s", self.file)
+            self._parsing_errors.append(f"File is empty: {self.file}")
             return None
 
         object_set: spdx3.SHACLObjectSet = spdx3.SHACLObjectSet()
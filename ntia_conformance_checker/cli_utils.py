@@ -7,11 +7,15 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import json
 import logging
+import os
 import re
 import sys
+from functools import lru_cache
 from importlib.metadata import version
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from spdx_tools.spdx.parser.error import SPDXParsingError
@@ -37,9 +41,75 @@ _OUTPUT_CHOICES = {
     "quiet": "No output unless there are errors",
 }
 
+# File extensions of formats that get_spdx_version() does not support
+_UNSUPPORTED_SUFFIXES = frozenset({".xls", ".xlsx"})
+
+# Signatures of container formats used by spreadsheets, so an Excel file
+# is rejected even without an Excel file extension:
+# OLE2 compound file (.xls) and ZIP archive (.xlsx)
+_UNSUPPORTED_MAGIC_NUMBERS = (b"\xd0\xcf\x11\xe0", b"PK\x03\x04")
+
+# Number of bytes read from the start of a file to detect its SPDX version
+_HEAD_SIZE = 4096
+
+# Match MAJOR.MINOR in an SPDX version string, e.g. "SPDX-2.3"
+_SPDX_VERSION_STRING = re.compile(r"SPDX-(\d+)\.(\d+)")
+
+# Match MAJOR.MINOR.PATCH version
+# SPDX 2 tag:value # SPDXVersion: SPDX-2.2
+_TAG_VALUE_VERSION = re.compile(
+    r"^\s*SPDXVersion\s*:\s*SPDX-(\d+)\.(\d+)(\.(\d+))?", re.MULTILINE
+)
+# SPDX 2 JSON # "spdxVersion": "SPDX-2.2.1"
+_JSON_VERSION = re.compile(
+    r"['\"]spdxVersion['\"]\s*:\s*['\"]SPDX-(\d+)\.(\d+)(\.(\d+))?"
+)
+# SPDX 2 YAML # spdxVersion: 'SPDX-2.2' or spdxVersion: SPDX-2.2
+_YAML_VERSION = re.compile(
+    r"^\s*spdxVersion\s*:\s*['\"]?SPDX-(\d+)\.(\d+)(\.(\d+))?", re.MULTILINE
+)
+# SPDX 2 XML # <spdxVersion>SPDX-2.2</spdxVersion>
+_XML_VERSION = re.compile(
+    r"<spdxVersion>\s*SPDX-(\d+)\.(\d+)(\.(\d+))?\s*</spdxVersion>"
+)
+# SPDX 2 RDF XML # <spdx:specVersion>SPDX-2.2</spdx:specVersion>
+_RDF_VERSION = re.compile(r"[:<]specVersion>\s*SPDX-(\d+)\.(\d+)(\.(\d+))?\s*<")
+# SPDX 3 JSON-LD # "@context": "https://spdx.org/rdf/3.0/spdx-context.jsonld"
+_JSONLD_CONTEXT_VERSION = re.compile(
+    r"[\'\"]@context[\'\"]\s*:\s*[\'\"]https?://spdx\.org/rdf/(\d+)\.(\d+)(\.(\d+))?/"
+)
+
+_SPDX_VERSION_PATTERNS = (
+    _TAG_VALUE_VERSION,
+    _JSON_VERSION,
+    _YAML_VERSION,
+    _XML_VERSION,
+    _RDF_VERSION,
+    _JSONLD_CONTEXT_VERSION,
+)
 
-def get_parsed_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+
+def _patterns_preferring(*preferred: re.Pattern[str]) -> tuple[re.Pattern[str], ...]:
+    """Return all version patterns, with the preferred ones tried first."""
+    return preferred + tuple(p for p in _SPDX_VERSION_PATTERNS if p not in preferred)
+
+
+# Version patterns ordered by the serialization a file extension suggests.
+# The other patterns are still tried, in case the extension is misleading.
+_SPDX_VERSION_PATTERNS_BY_SUFFIX = {
+    ".spdx": _patterns_preferring(_TAG_VALUE_VERSION),
+    ".json": _patterns_preferring(_JSON_VERSION, _JSONLD_CONTEXT_VERSION),
+    ".jsonld": _patterns_preferring(_JSONLD_CONTEXT_VERSION, _JSON_VERSION),
+    ".yaml": _patterns_preferring(_YAML_VERSION),
+    ".yml": _patterns_preferring(_YAML_VERSION),
+    ".xml": _patterns_preferring(_XML_VERSION, _RDF_VERSION),
+    ".rdf": _patterns_preferring(_RDF_VERSION),
+}
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser (built once and reused)."""
 
     epilog_text = (
         "choices:\n"
@@ -138,6 +208,12 @@ def get_parsed_args() -> argparse.Namespace:
         help="Display version of sbomcheck",
     )
 
+    return parser
+
+
+def get_parsed_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if getattr(args, "file_opt", None):
@@ -157,6 +233,11 @@ def get_spdx_version(file: str, sbom_spec: str = "spdx2") -> tuple[int, int] | N
     """
     Detect the SPDX version of the SBOM file.
 
+    The version declared in the first few kilobytes of the file is used
+    when found, without parsing the whole document; otherwise the file is
+    parsed with spdx_tools (for SPDX 2) and then scanned in full.
+    The file must be valid UTF-8.
+
     XLS file format is not supported.
 
     Args:
@@ -169,16 +250,29 @@ def get_spdx_version(file: str, sbom_spec: str = "spdx2") -> tuple[int, int] | N
                                 E.g. (2, 3) for version 2.3.
                                 Returns None if the version cannot be determined.
     """
-    if file.lower().endswith((".xls", ".xlsx")):
+    suffix = Path(file).suffix.lower()
+    if suffix in _UNSUPPORTED_SUFFIXES:
         logging.debug("Detect SPDX version: Excel file format is not supported")
         return None
 
+    # One byte past the head tells whether the whole file was read
+    head = _read_head(file, _HEAD_SIZE + 1)
+    if head and head.startswith(_UNSUPPORTED_MAGIC_NUMBERS):
+        logging.debug("Detect SPDX version: Binary file format is not supported")
+        return None
+
+    # Most serializations declare the version near the top of the file,
+    # so look there before parsing the whole document
+    if head and (text := _decode_head(head, final=len(head) <= _HEAD_SIZE)):
+        if spdx_version := _parse_spdx_version_from_content(text, suffix):
+            return spdx_version
+
     # Try parsing the file with spdx_tools first
     if sbom_spec == "spdx2":
         try:
             doc = parse_spdx2_file(file)
             ver = getattr(doc.creation_info, "spdx_version", None)
-            if isinstance(ver, str) and (m := re.search(r"SPDX-(\d+)\.(\d+)", ver)):
+            if isinstance(ver, str) and (m := _SPDX_VERSION_STRING.search(ver)):
                 return int(m.group(1)), int(m.group(2))
         except (SPDXParsingError, ValueError, TypeError, OSError) as exc:
             logging.debug("Detect SPDX version: spdx_tools parser failed: %s", exc)
@@ -191,35 +285,64 @@ def get_spdx_version(file: str, sbom_spec: str = "spdx2") -> tuple[int, int] | N
     try:
         with open(file, "r", encoding="utf-8") as f:
             content = f.read()
-            return _parse_spdx_version_from_content(content)
+            return _parse_spdx_version_from_content(content, suffix)
     except (OSError, UnicodeDecodeError) as exc:
         logging.debug("Detect SPDX version: Could not read file: %s", exc)
         return None
 
 
-def _parse_spdx_version_from_content(content: str) -> tuple[int, int] | None:
-    """Parse SPDX version from file content using regular expressions."""
-    # Match MAJOR.MINOR.PATCH version
-    patterns = [
-        re.compile(
-            r"^\s*SPDXVersion\s*:\s*SPDX-(\d+)\.(\d+)(\.(\d+))?", re.MULTILINE
-        ),  # SPDX 2 tag:value # SPDXVersion: SPDX-2.2
-        re.compile(
-            r"['\"]spdxVersion['\"]\s*:\s*['\"]SPDX-(\d+)\.(\d+)(\.(\d+))?"
-        ),  # SPDX 2 JSON # "spdxVersion": "SPDX-2.2.1"
-        re.compile(
-            r"^\s*spdxVersion\s*:\s*['\"]?SPDX-(\d+)\.(\d+)(\.(\d+))?", re.MULTILINE
-        ),  # SPDX 2 YAML # spdxVersion: 'SPDX-2.2' or spdxVersion: SPDX-2.2
-        re.compile(
-            r"<spdxVersion>\s*SPDX-(\d+)\.(\d+)(\.(\d+))?\s*</spdxVersion>"
-        ),  # SPDX 2 XML # <spdxVersion>SPDX-2.2</spdxVersion>
-        re.compile(
-            r"[:<]specVersion>\s*SPDX-(\d+)\.(\d+)(\.(\d+))?\s*<"
-        ),  # SPDX 2 RDF XML # <spdx:specVersion>SPDX-2.2</spdx:specVersion>
-        re.compile(
-            r"[\'\"]@context[\'\"]\s*:\s*[\'\"]https?://spdx\.org/rdf/(\d+)\.(\d+)(\.(\d+))?/"
-        ),  # SPDX 3 JSON-LD # "@context": "https://spdx.org/rdf/3.0/spdx-context.jsonld"
-    ]
+def _read_head(file: str, size: int = _HEAD_SIZE) -> bytes | None:
+    """Read the first `size` bytes of a file, or None if unreadable."""
+    # A raw file descriptor avoids setting up a buffered file object
+    # for a single small read
+    try:
+        fd = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            return os.read(fd, size)
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        logging.debug("Detect SPDX version: Could not read file: %s", exc)
+        return None
+
+
+def _decode_head(head: bytes, final: bool) -> str | None:
+    """
+    Decode the start of a file as UTF-8.
+
+    Args:
+        head (bytes): The bytes read from the start of the file.
+        final (bool): Whether head holds the whole file.
+
+    Returns:
+        str | None: The decoded text, or None if it is not valid UTF-8.
+    """
+    # Unless the file was read to its end, the head may stop in the middle
+    # of a multi-byte character, which an incremental decoder holds back
+    # instead of rejecting
+    try:
+        return codecs.getincrementaldecoder("utf-8")().decode(head, final=final)
+    except UnicodeDecodeError as exc:
+        logging.debug("Detect SPDX version: Could not decode file: %s", exc)
+        return None
+
+
+def _parse_spdx_version_from_content(
+    content: str, suffix: str = ""
+) -> tuple[int, int] | None:
+    """
+    Parse SPDX version from file content using regular expressions.
+
+    Args:
+        content (str): The file content, or its beginning.
+        suffix (str): The lowercase file extension, e.g. ".json". Patterns for
+                      the serialization it suggests are tried first.
+
+    Returns:
+        tuple[int, int] | None: The SPDX major.minor version, or None if no
+                                pattern matches.
+    """
+    patterns = _SPDX_VERSION_PATTERNS_BY_SUFFIX.get(suffix, _SPDX_VERSION_PATTERNS)
     for pat in patterns:
         if m := pat.search(content):
             return int(m.group(1)), int(m.group(2))  # Returns (MAJOR, MINOR)
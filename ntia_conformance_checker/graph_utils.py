@@ -4,6 +4,7 @@
 
 """Graph utilities for SPDX 2 and SPDX 3."""
 
+from collections import deque
 from typing import TYPE_CHECKING, Any, cast
 
 from spdx_python_model.bindings import v3_0_1 as spdx3
@@ -88,9 +89,7 @@ def _build_spdx2_graph(spdx2_doc: "Document") -> tuple[list[str], dict[str, list
 
         # Build the graph connection map
         if rel.relationship_type.name in VALID_SPDX2_COMPOSITION_RELATIONSHIPS:
-            if source_id not in graph_connection_map:
-                graph_connection_map[source_id] = []
-            graph_connection_map[source_id].append(target_id)
+            graph_connection_map.setdefault(source_id, []).append(target_id)
     return queue, graph_connection_map
 
 
@@ -119,9 +118,7 @@ def _extract_spdx3_relationship_edges(
         for t in getattr(obj, "to", [])
     ]
 
-    if from_id not in graph_connection_map:
-        graph_connection_map[from_id] = []
-    graph_connection_map[from_id].extend([t for t in to_ids if t])
+    graph_connection_map.setdefault(from_id, []).extend([t for t in to_ids if t])
 
 
 def _extract_spdx3_collection_edges(
@@ -132,14 +129,14 @@ def _extract_spdx3_collection_edges(
     if not col_id:
         return
 
-    if col_id not in graph_connection_map:
-        graph_connection_map[col_id] = []
+    # Look up the edge list once, not once per member element
+    edges = graph_connection_map.setdefault(col_id, [])
 
     for attr in ("rootElement", "element"):
         for elem in getattr(obj, attr, []):
             e_id = elem if isinstance(elem, str) else getattr(elem, "spdxId", "")
             if e_id:
-                graph_connection_map[col_id].append(e_id)
+                edges.append(e_id)
 
 
 def _build_spdx3_graph(
@@ -199,24 +196,27 @@ def get_reachable_components(
     if not parsed_data:
         return set(), {}
 
-    queue: list[str] = []
+    roots: list[str] = []
 
     # graph_connection_map: source_id -> list[target_ids]
     graph_connection_map: dict[str, list[str]] = {}
 
     # SPDX 2
     if sbom_spec == "spdx2":
-        queue, graph_connection_map = _build_spdx2_graph(parsed_data)
+        roots, graph_connection_map = _build_spdx2_graph(parsed_data)
 
     # SPDX 3
     if sbom_spec == "spdx3":
-        queue, graph_connection_map = _build_spdx3_graph(parsed_data, spdx3_doc)
+        roots, graph_connection_map = _build_spdx3_graph(parsed_data, spdx3_doc)
 
-    reachable_component_ids: set[str] = set(queue)
+    reachable_component_ids: set[str] = set(roots)
 
-    # Perform BFS to find all reachable components
+    # Perform BFS to find all reachable components.
+    # A deque gives O(1) pops from the left; list.pop(0) is O(n) and made
+    # the traversal quadratic on SBOMs with many components.
+    queue: deque[str] = deque(roots)
     while queue:
-        current_id = queue.pop(0)
+        current_id = queue.popleft()
 
         if current_id in graph_connection_map:
             for target_id in graph_connection_map[current_id]:
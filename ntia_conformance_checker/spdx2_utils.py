@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 SPDX contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers for SPDX 2."""
+
+from __future__ import annotations
+
+from itertools import compress
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from spdx_tools.spdx.model.spdx_no_assertion import SpdxNoAssertion
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from spdx_tools.spdx.model.package import Package
+
+
+# Component information checked by scan_packages(), using the same keys as
+# BaseChecker._COMPONENTS_WITHOUT_INFO.
+SPDX2_COMPONENT_INFO = (
+    "name",
+    "version",
+    "identifier",
+    "supplier",
+    "concluded_license",
+    "copyright_text",
+)
+
+# Package property holding each piece of component information
+_PACKAGE_PROPERTIES = {
+    "name": "name",
+    "version": "version",
+    "identifier": "spdx_id",
+    "supplier": "supplier",
+    "concluded_license": "license_concluded",
+    "copyright_text": "copyright_text",
+}
+
+# Package properties identifying a component, as (component_name, spdx_id)
+_COMPONENT = attrgetter("name", "spdx_id")
+
+
+def is_missing_value(value: Any) -> bool:
+    """Return True if a package property is absent, NOASSERTION, or blank."""
+    # spdx-tools has no NOASSERTION singleton and never subclasses
+    # SpdxNoAssertion, so an exact type check is enough and cheaper
+    # than isinstance() on this per-package path.
+    # pylint: disable=unidiomatic-typecheck
+    return (
+        value is None
+        or type(value) is SpdxNoAssertion
+        or (isinstance(value, str) and value.strip() == "")
+    )
+
+
+def scan_packages(
+    packages: Iterable[Package] | None,
+    reachable_ids: set[str],
+    info_names: Iterable[str] = SPDX2_COMPONENT_INFO,
+) -> dict[str, list[tuple[str, str]]]:
+    """
+    Find reachable SPDX 2 packages missing each piece of component information.
+
+    Only the requested package properties are read. When several are
+    requested, they are fetched in a single pass over the packages, then
+    each property column is filtered separately.
+
+    Args:
+        packages (Iterable[Package] | None): The packages of an SPDX 2
+            document. None or empty when there is no document.
+        reachable_ids (set[str]): SPDX IDs reachable from the document root.
+            Packages outside this set are ignored.
+        info_names (Iterable[str]): The information to check, a subset of
+            SPDX2_COMPONENT_INFO. Defaults to all of it.
+
+    Returns:
+        dict[str, list[tuple[str, str]]]: A mapping from each requested
+        information name to a list of (component_name, spdx_id) tuples of
+        the packages missing that information.
+    """
+    info_names = tuple(info_names)
+    if not packages or not reachable_ids:
+        return {info_name: [] for info_name in info_names}
+
+    # compress() and map() drive the selection loops in C
+    if len(info_names) == 1:
+        # A single property: name and SPDX ID are only read for the
+        # packages missing it
+        info_name = info_names[0]
+        reachable = [
+            package for package in packages if package.spdx_id in reachable_ids
+        ]
+        values = map(attrgetter(_PACKAGE_PROPERTIES[info_name]), reachable)
+        missing = compress(reachable, map(is_missing_value, values))
+        return {
+            info_name: [
+                (name or "", spdx_id or "")
+                for name, spdx_id in map(_COMPONENT, missing)
+            ]
+        }
+
+    # SPDX ID first for the reachability filter, each property read once
+    properties = tuple(
+        dict.fromkeys(
+            (
+                "spdx_id",
+                "name",
+                *(_PACKAGE_PROPERTIES[info_name] for info_name in info_names),
+            )
+        )
+    )
+    rows = [
+        row for row in map(attrgetter(*properties), packages) if row[0] in reachable_ids
+    ]
+    if not rows:
+        return {info_name: [] for info_name in info_names}
+
+    # Transpose the package rows into one column per property
+    columns = dict(zip(properties, zip(*rows)))
+    components = [
+        (name or "", spdx_id or "")
+        for spdx_id, name in zip(columns["spdx_id"], columns["name"])
+    ]
+    return {
+        info_name: list(
+            compress(
+                components,
+                map(is_missing_value, columns[_PACKAGE_PROPERTIES[info_name]]),
+            )
+        )
+        for info_name in info_names
+    }
@@ -7,7 +7,9 @@
 # pylint: disable=missing-function-docstring,import-error,consider-using-from-import
 
 import os
-import warnings
+import re
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from unittest import TestCase
 
@@ -15,7 +17,7 @@ import pytest
 from spdx_python_model.bindings import v3_0_1 as spdx3
 
 import ntia_conformance_checker.sbom_checker as sbom_checker
-from ntia_conformance_checker import FSCT3Checker, NTIAChecker
+from ntia_conformance_checker import BaseChecker, FSCT3Checker, NTIAChecker
 from ntia_conformance_checker.spdx3_utils import (
     has_package_dependency_relationship,
     validate_spdx3_data,
@@ -49,63 +51,52 @@ def _spdx3_package_dependency_object_set() -> spdx3.SHACLObjectSet:
     return sbom.doc
 
 
-### Test no element missing
+# Parsing an SBOM dominates the run time of most tests. Tests that only read
+# from a checker share one module-scoped instance per file instead of
+# re-parsing it. Tests that modify a checker must create their own.
 
-dirname = os.path.join(os.path.dirname(__file__), "data", "no_elements_missing")
-test_files = [os.path.join(dirname, fn) for fn in os.listdir(dirname)]
 
+@pytest.fixture(scope="module", name="example_sbom")
+def fixture_example_sbom() -> BaseChecker:
+    filepath = os.path.join(
+        os.path.dirname(__file__), "data", "other_tests", "SPDXSBOMExample.spdx.yml"
+    )
+    sbom: BaseChecker = sbom_checker.SbomChecker(filepath)
+    return sbom
 
-@pytest.mark.parametrize("test_file", test_files)
-def test_sbomchecker_ntia_no_errors(test_file: str) -> None:
-    # No compliance argument is given to SbomChecker; Default is "ntia"
-    sbom = sbom_checker.SbomChecker(test_file)
-    assert sbom.file == test_file
-    assert sbom.doc_version
-    assert sbom.doc_author
-    assert sbom.doc_timestamp
-    assert not sbom.sbom_gen_context  # SPDX 2 does not have SBOM type
-    assert sbom.dependency_relationships
-    assert not sbom.components_without_names
-    assert not sbom.components_without_versions
-    assert not sbom.components_without_suppliers
-    assert not sbom.components_without_identifiers
-    assert sbom.compliant
 
+@pytest.fixture(scope="module", name="spdx3_has_no_sbom")
+def fixture_spdx3_has_no_sbom() -> BaseChecker:
+    test_file = Path(__file__).parent / "data" / "spdx3" / "has_no_sbom.json"
+    sbom: BaseChecker = sbom_checker.SbomChecker(str(test_file), sbom_spec="spdx3")
+    return sbom
 
-@pytest.mark.parametrize("test_file", test_files)
-def test_sbomchecker_fsct3_no_errors(test_file: str) -> None:
-    sbom = sbom_checker.SbomChecker(test_file, compliance="fsct3-min")
-    assert sbom.file == test_file
-    assert sbom.doc_version
-    assert sbom.doc_author
-    assert sbom.doc_timestamp
-    assert not sbom.sbom_gen_context  # SPDX 2 does not have SBOM type
-    assert sbom.dependency_relationships
-    assert not sbom.components_without_names
-    assert not sbom.components_without_versions
-    assert not sbom.components_without_suppliers
-    assert not sbom.components_without_identifiers
-    assert not sbom.components_without_concluded_licenses
 
+### Test no element missing
 
-@pytest.mark.parametrize("test_file", test_files)
-def test_ntiachecker_no_errors(test_file: str) -> None:
-    sbom = NTIAChecker(test_file)
-    assert sbom.file == test_file
-    assert sbom.doc_version
-    assert sbom.doc_author
-    assert sbom.doc_timestamp
-    assert sbom.dependency_relationships
-    assert not sbom.components_without_names
-    assert not sbom.components_without_versions
-    assert not sbom.components_without_suppliers
-    assert not sbom.components_without_identifiers
-    assert sbom.compliant
+dirname = os.path.join(os.path.dirname(__file__), "data", "no_elements_missing")
+test_files = [os.path.join(dirname, fn) for fn in os.listdir(dirname)]
+
+
+# Checker constructors that must find no missing elements in test_files
+no_errors_checkers: list[Callable[[str], BaseChecker]] = [
+    sbom_checker.SbomChecker,  # No compliance argument; Default is "ntia"
+    partial(sbom_checker.SbomChecker, compliance="fsct3-min"),
+    NTIAChecker,
+    FSCT3Checker,
+]
 
 
 @pytest.mark.parametrize("test_file", test_files)
-def test_fsct3checker_no_errors(test_file: str) -> None:
-    sbom = FSCT3Checker(test_file)
+@pytest.mark.parametrize(
+    "make_checker",
+    no_errors_checkers,
+    ids=["sbomchecker-ntia", "sbomchecker-fsct3", "ntiachecker", "fsct3checker"],
+)
+def test_checker_no_errors(
+    make_checker: Callable[[str], BaseChecker], test_file: str
+) -> None:
+    sbom = make_checker(test_file)
     assert sbom.file == test_file
     assert sbom.doc_version
     assert sbom.doc_author
@@ -116,7 +107,12 @@ def test_fsct3checker_no_errors(test_file: str) -> None:
     assert not sbom.components_without_versions
     assert not sbom.components_without_suppliers
     assert not sbom.components_without_identifiers
-    assert not sbom.components_without_concluded_licenses
+    if sbom.compliance_standard == "ntia":
+        assert sbom.compliant
+    else:
+        # SPDX 2 has no SBOM type, so it cannot be FSCTv3 compliant;
+        # check the FSCTv3 component information instead
+        assert not sbom.components_without_concluded_licenses
 
 
 ### Test missing author name
@@ -322,9 +318,8 @@ def test_sbomchecker_alpine_no_package_supplier_name_example() -> None:
 ### Test SPDX 3 SBOM examples
 
 
-def test_sbomchecker_spdx3_general() -> None:
-    test_file = Path(__file__).parent / "data" / "spdx3" / "has_no_sbom.json"
-    sbom = sbom_checker.SbomChecker(str(test_file), sbom_spec="spdx3")
+def test_sbomchecker_spdx3_general(spdx3_has_no_sbom: BaseChecker) -> None:
+    sbom = spdx3_has_no_sbom
     assert sbom.doc is not None
     assert isinstance(sbom.doc, spdx3.SHACLObjectSet)
     assert sbom.sbom_name == "hello"
@@ -462,12 +457,8 @@ def test_sbomchecker_spdx3_missing_unique_identifiers() -> None:
 ### Other tests
 
 
-def test_sbomchecker_output_json() -> None:
-    filepath = os.path.join(
-        os.path.dirname(__file__), "data", "other_tests", "SPDXSBOMExample.spdx.yml"
-    )
-    sbom = sbom_checker.SbomChecker(filepath)
-    got = sbom.output_json()
+def test_sbomchecker_output_json(example_sbom: BaseChecker) -> None:
+    got = example_sbom.output_json()
     assert got["sbomName"] == "xyz-0.1.0"
     assert not got["isNtiaConformant"]
     assert not got["isConformant"]
@@ -490,23 +481,18 @@ def test_sbomchecker_output_json() -> None:
     assert got["totalNumberComponents"] == 3
 
 
-def test_sbomchecker_output_json_validation_messages() -> None:
-    test_file = Path(__file__).parent / "data" / "spdx3" / "has_no_sbom.json"
-    sbom = sbom_checker.SbomChecker(str(test_file), sbom_spec="spdx3")
-    got = sbom.output_json()
+def test_sbomchecker_output_json_validation_messages(
+    spdx3_has_no_sbom: BaseChecker,
+) -> None:
+    got = spdx3_has_no_sbom.output_json()
     assert got["conformanceMessages"]
     print(got["conformanceMessages"][0]["message"])
     assert "rootElement" in got["conformanceMessages"][0]["message"]
     assert "SBOM type" in got["conformanceMessages"][0]["message"]
 
 
-def test_sbomchecker_output_html() -> None:
-    filepath = os.path.join(
-        os.path.dirname(__file__), "data", "other_tests", "SPDXSBOMExample.spdx.yml"
-    )
-    sbom = sbom_checker.SbomChecker(filepath)
-
-    got = sbom.output_html()
+def test_sbomchecker_output_html(example_sbom: BaseChecker) -> None:
+    got = example_sbom.output_html()
     expected = (
         "<div class='conformance-res'>\n"
         "<h2 class='conformance-res-title'>"
@@ -623,17 +609,162 @@ def test_components_without_functions() -> None:
     # assert components == ["glibc-no-identifier"]
 
 
+def test_components_without_functions_document_changed() -> None:
+    """Test that results follow changes to the document after parsing."""
+    filepath = os.path.join(
+        os.path.dirname(__file__),
+        "data",
+        "other_tests",
+        "test_components_without_functions.spdx",
+    )
+    sbom = sbom_checker.SbomChecker(filepath)
+    assert sbom.get_components_without_names() == [("", "SPDXRef-Package1")]
+
+    # Package edited in place
+    packages = sbom.doc.packages
+    package = next(pkg for pkg in packages if pkg.spdx_id == "SPDXRef-Package1")
+    package.name = "now-named"
+    assert sbom.get_components_without_names() == []
+
+    # Package removed
+    packages.remove(package)
+    assert sbom.get_components_without_suppliers() == [
+        ("glibc-no-supplier", "SPDXRef-Package4")
+    ]
+
+    # No package reachable any more
+    sbom.reachable_component_ids = set()
+    assert sbom.get_components_without_suppliers() == []
+
+
+@pytest.mark.parametrize(
+    "test_file",
+    [
+        os.path.join(
+            os.path.dirname(__file__),
+            "data",
+            "other_tests",
+            "test_components_without_functions.spdx",
+        ),
+        *files,
+    ],
+)
+def test_components_without_functions_match_attributes(test_file: str) -> None:
+    """Test that each SPDX 2 getter agrees with the scan done on creation."""
+    sbom = sbom_checker.SbomChecker(test_file)
+    for attribute in (
+        "components_without_names",
+        "components_without_versions",
+        "components_without_identifiers",
+        "components_without_suppliers",
+        "components_without_concluded_licenses",
+        "components_without_copyright_texts",
+    ):
+        getter = getattr(sbom, f"get_{attribute}")
+        assert getter() == getattr(sbom, attribute), attribute
+
+
+@pytest.mark.parametrize("sbom_spec", ["spdx2", "spdx3"])
+@pytest.mark.parametrize(
+    "test_file, expected_error",
+    [
+        (Path(__file__).parent / "data" / "does_not_exist.json", "File not found"),
+        (Path(__file__).parent / "data", "Not a regular file"),  # a directory
+    ],
+)
+def test_sbomchecker_file_not_found(
+    test_file: Path, expected_error: str, sbom_spec: str
+) -> None:
+    sbom = sbom_checker.SbomChecker(str(test_file), sbom_spec=sbom_spec)
+    assert sbom.doc is None
+    assert not sbom.compliant
+    assert sbom.parsing_errors == [f"{expected_error}: {test_file}"]
+
+
+@pytest.mark.parametrize("sbom_spec", ["spdx2", "spdx3"])
+def test_basechecker_no_doc(sbom_spec: str) -> None:
+    # Bypass __init__: there is no document to parse for this test
+    sbom = NTIAChecker.__new__(NTIAChecker)
+    sbom.sbom_spec = sbom_spec
+    assert sbom.doc is None
+    assert not sbom.check_doc_version()
+    assert not sbom.check_author()
+    assert not sbom.check_timestamp()
+    assert not sbom.check_dependency_relationships()
+    assert sbom.get_sbom_name() == ""
+    assert sbom.get_sbom_types() == []
+    assert sbom.get_total_number_components() == 0
+    assert sbom.get_components_without_names() == []
+    assert sbom.get_components_without_versions() == []
+    assert sbom.get_components_without_identifiers() == []
+    assert sbom.get_components_without_suppliers() == []
+    assert sbom.get_components_without_concluded_licenses() == []
+    assert sbom.get_components_without_copyright_texts() == []
+
+
+@pytest.fixture(scope="session", name="invalid_json_path")
+def fixture_invalid_json_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write a malformed JSON file once and share it across tests."""
+    path = tmp_path_factory.mktemp("invalid_json") / "invalid.json"
+    path.write_text("{invalid json content", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("sbom_spec", ["spdx2", "spdx3"])
+def test_sbomchecker_invalid_json(invalid_json_path: str, sbom_spec: str) -> None:
+    sbom = sbom_checker.SbomChecker(invalid_json_path, sbom_spec=sbom_spec)
+    assert sbom.doc is None
+    assert not sbom.compliant
+    assert sbom.parsing_errors
+
+
+def test_sbomchecker_spdx3_empty_file(tmp_path: Path) -> None:
+    test_file = tmp_path / "empty.json"
+    test_file.touch()
+    sbom = sbom_checker.SbomChecker(str(test_file), sbom_spec="spdx3")
+    assert sbom.doc is None
+    assert sbom.parsing_errors == [f"File is empty: {test_file}"]
+
+
+# Invalid arguments are rejected whether or not the file exists,
+# so these tests use a dummy path
+
+UNSUPPORTED_SBOM_SPEC_RE = re.compile("Unsupported SBOM specification")
+UNKNOWN_COMPLIANCE_RE = re.compile("Unknown compliance standard")
+NTIA_ONLY_RE = re.compile("Only NTIA Minimum Element compliance")
+FSCT3_ONLY_RE = re.compile("Only FSCTv3 Minimum Expected compliance")
+
+
+def test_sbomchecker_unsupported_sbom_spec() -> None:
+    with pytest.raises(ValueError, match=UNSUPPORTED_SBOM_SPEC_RE):
+        sbom_checker.SbomChecker("dummy.spdx", sbom_spec="unsupported")
+
+
+def test_sbomchecker_unknown_compliance() -> None:
+    with pytest.raises(ValueError, match=UNKNOWN_COMPLIANCE_RE):
+        sbom_checker.SbomChecker("dummy.spdx", compliance="unknown")
+
+
+def test_ntiachecker_invalid_compliance() -> None:
+    with pytest.raises(ValueError, match=NTIA_ONLY_RE):
+        NTIAChecker("dummy.spdx", compliance="fsct3-min")
+
+
+def test_fsct3checker_invalid_compliance() -> None:
+    with pytest.raises(ValueError, match=FSCT3_ONLY_RE):
+        FSCT3Checker("dummy.spdx", compliance="ntia")
+
+
 def test_deprecation_ntia_minimum_elements_compliant() -> None:
     """Test that accessing the deprecated property
     `ntia_minimum_elements_compliant`
     raises a DeprecationWarning."""
     sbom = sbom_checker.SbomChecker(test_files[0])
-    with warnings.catch_warnings(record=True) as caught:
-        warnings.simplefilter("always")
+    with pytest.warns(
+        DeprecationWarning, match="ntia_minimum_elements_compliant"
+    ) as caught:
         _ = sbom.ntia_minimum_elements_compliant
     assert len(caught) == 1
-    assert issubclass(caught[0].category, DeprecationWarning)
-    assert "ntia_minimum_elements_compliant" in str(caught[0].message)
 
 
 def test_deprecation_parsing_error() -> None:
@@ -641,12 +772,9 @@ def test_deprecation_parsing_error() -> None:
     `parsing_error`
     raises a DeprecationWarning."""
     sbom = sbom_checker.SbomChecker(test_files[0])
-    with warnings.catch_warnings(record=True) as caught:
-        warnings.simplefilter("always")
+    with pytest.warns(DeprecationWarning, match="parsing_error") as caught:
         _ = sbom.parsing_error
     assert len(caught) == 1
-    assert issubclass(caught[0].category, DeprecationWarning)
-    assert "parsing_error" in str(caught[0].message)
 
 
 ### Test missing relationship target
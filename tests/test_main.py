@@ -9,6 +9,8 @@
 from pathlib import Path
 from typing import List, Tuple
 
+import pytest
+
 from ntia_conformance_checker.cli_utils import get_sbom_spec, get_spdx_version
 
 spdx2_2_dir = Path(__file__).parent / "data" / "missing_component_name"
@@ -30,12 +32,45 @@ detect_version_test: List[Tuple[Path, Tuple[int, ...]]] = [
 ]
 
 
-def test_detect_spdx_version() -> None:
-    for file_path, expected_version in detect_version_test:
-        version = get_spdx_version(str(file_path))
-        assert (
-            version == expected_version
-        ), f"Expected {expected_version}, got {version} for {file_path}"
+@pytest.mark.parametrize("file_path, expected_version", detect_version_test)
+def test_detect_spdx_version(
+    file_path: Path, expected_version: Tuple[int, ...]
+) -> None:
+    assert get_spdx_version(str(file_path)) == expected_version
+
+
+detect_version_content_test: List[Tuple[str, bytes, Tuple[int, ...] | None]] = [
+    (".spdx", b"SPDXVersion: SPDX-2.3\n", (2, 3)),
+    (".json", b'{"spdxVersion": "SPDX-2.2"}', (2, 2)),
+    (".yaml", b"spdxVersion: SPDX-2.3\n", (2, 3)),
+    (".yaml", b"spdxVersion: 'SPDX-2.2'\n", (2, 2)),
+    (".xml", b"<spdxVersion>SPDX-2.3</spdxVersion>", (2, 3)),
+    (
+        ".json",
+        b'{"@context": "https://spdx.org/rdf/3.0.1/spdx-context.jsonld"}',
+        (3, 0),
+    ),
+    (".spdx", b"SPDXVersion: SPDX-2.3.1\n", (2, 3)),
+    (".spdx", b"PackageName: no-version\n", None),
+    (".spdx", b"\xff\xfe\nSPDXVersion: SPDX-2.3\n", None),  # Not valid UTF-8
+    (".spdx", b"SPDXVersion: SPDX-2.3\n\xc3", None),  # Truncated at end of file
+    (".spdx", b"SPDXVersion: SPDX-2.3\n" + b"#" * 4073 + b"\xc3", None),  # 4 KiB
+    # Multi-byte character split at the end of the head read
+    (".spdx", b"SPDXVersion: SPDX-2.3\n" + b"#" * 4074 + "\u00e9\n".encode(), (2, 3)),
+    (".xls", b"SPDXVersion: SPDX-2.3\n", None),  # Excel is not supported
+    (".XLSX", b"SPDXVersion: SPDX-2.3\n", None),
+    (".spdx", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1SPDXVersion: SPDX-2.3\n", None),  # XLS
+    (".spdx", b"PK\x03\x04SPDXVersion: SPDX-2.3\n", None),  # XLSX (ZIP)
+]
+
+
+@pytest.mark.parametrize("suffix, content, expected", detect_version_content_test)
+def test_detect_spdx_version_from_content(
+    tmp_path: Path, suffix: str, content: bytes, expected: Tuple[int, ...] | None
+) -> None:
+    file_path = tmp_path / f"sbom{suffix}"
+    file_path.write_bytes(content)
+    assert get_spdx_version(str(file_path)) == expected
 
 
 detect_sbom_spec_test: List[Tuple[Path, str]] = [
@@ -52,9 +87,7 @@ detect_sbom_spec_test: List[Tuple[Path, str]] = [
 ]
 
 
-def test_detect_sbom_spec() -> None:
-    for file_path, expected_sbom_spec in detect_sbom_spec_test:
-        sbom_spec = get_sbom_spec(str(file_path), sbom_spec=expected_sbom_spec)
-        assert (
-            sbom_spec == expected_sbom_spec
-        ), f"Expected {expected_sbom_spec}, got {sbom_spec} for {file_path}"
+@pytest.mark.parametrize("file_path, expected_sbom_spec", detect_sbom_spec_test)
+def test_detect_sbom_spec(file_path: Path, expected_sbom_spec: str) -> None:
+    sbom_spec = get_sbom_spec(str(file_path), sbom_spec=expected_sbom_spec)
+    assert sbom_spec == expected_sbom_spec
@@ -0,0 +1,269 @@
+# SPDX-FileCopyrightText: 2026 SPDX contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests report functions"""
+
+# pylint: disable=missing-function-docstring
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from ntia_conformance_checker.report import (
+    _safe_attr,
+    get_validation_messages_html,
+    get_validation_messages_text,
+    print_validation_messages,
+)
+
+if TYPE_CHECKING:
+    from spdx_tools.spdx.validation.validation_message import ValidationMessage
+
+# The report functions only read attributes of validation messages and their
+# contexts, so lightweight SimpleNamespace objects stand in for
+# ValidationMessage and ValidationContext.
+
+
+def _message(
+    validation_message: str | None, context: object = None
+) -> ValidationMessage:
+    """Build a stand-in for a ValidationMessage."""
+    return cast(
+        "ValidationMessage",
+        SimpleNamespace(validation_message=validation_message, context=context),
+    )
+
+
+# Expected output for sample_msg_with_context
+EXPECTED_VERBOSE_TEXT = (
+    "Test validation error\n"
+    "- SPDX ID: SPDXRef-Package\n"
+    "- Parent ID: SPDXRef-Document\n"
+    "- Element type: Package\n"
+    "\n"
+)
+EXPECTED_HTML = (
+    "<ul class='conformance-val-list'>\n"
+    "<li>\n"
+    "<p class='conformance-val-msg-label'>Validation message:</p>\n"
+    "<p class='conformance-val-msg'>Test validation error</p>\n"
+    "</li>\n"
+    "</ul>"
+)
+EXPECTED_VERBOSE_HTML = (
+    "<ul class='conformance-val-list'>\n"
+    "<li>\n"
+    "<p class='conformance-val-msg-label'>Validation message:</p>\n"
+    "<p class='conformance-val-msg'>Test validation error</p>\n"
+    "<p class='conformance-val-ctx-label'>Validation context:</p>\n"
+    "<ul class='conformance-val-ctx'>\n"
+    "<li>SPDX ID: SPDXRef-Package</li>\n"
+    "<li>Parent ID: SPDXRef-Document</li>\n"
+    "<li>Element type: Package</li>\n"
+    "</ul>\n"
+    "</li>\n"
+    "</ul>"
+)
+
+
+class _NoAttributes:  # pylint: disable=too-few-public-methods
+    """An object with no attributes at all, not even an instance __dict__."""
+
+    __slots__ = ()
+
+
+# Shared, since it cannot be modified
+NO_ATTRIBUTES = _NoAttributes()
+
+# Expected fragments of the verbose output when no context attribute is set
+EMPTY_CONTEXT_TEXT_NEEDLES = (
+    "- SPDX ID: N/A",
+    "- Parent ID: N/A",
+    "- Element type: N/A",
+)
+EMPTY_CONTEXT_HTML_NEEDLES = (
+    "<p class='conformance-val-ctx-label'>Validation context:</p>",
+    "<li>SPDX ID: N/A</li>",
+    "<li>Parent ID: N/A</li>",
+    "<li>Element type: N/A</li>",
+)
+
+
+@pytest.fixture(scope="module", name="sample_context")
+def fixture_sample_context() -> SimpleNamespace:
+    return SimpleNamespace(
+        spdx_id="SPDXRef-Package",
+        parent_id="SPDXRef-Document",
+        element_type="Package",
+    )
+
+
+@pytest.fixture(scope="module", name="sample_msg_with_context")
+def fixture_sample_msg_with_context(
+    sample_context: SimpleNamespace,
+) -> ValidationMessage:
+    return _message("Test validation error", sample_context)
+
+
+@pytest.fixture(scope="module", name="sample_msg_with_empty_context")
+def fixture_sample_msg_with_empty_context() -> ValidationMessage:
+    return _message("Test validation error", NO_ATTRIBUTES)
+
+
+def test_print_validation_messages(
+    capsys: pytest.CaptureFixture[str], sample_msg_with_context: ValidationMessage
+) -> None:
+    print_validation_messages([sample_msg_with_context])
+    output = capsys.readouterr().out
+    assert output == "Test validation error\n\n"
+
+
+def test_print_validation_messages_verbose(
+    capsys: pytest.CaptureFixture[str], sample_msg_with_context: ValidationMessage
+) -> None:
+    print_validation_messages([sample_msg_with_context], verbose=True)
+    output = capsys.readouterr().out
+    assert output == EXPECTED_VERBOSE_TEXT
+
+
+def test_get_validation_messages_text_spdx_tools_message() -> None:
+    # Check the stand-ins against the real spdx-tools classes once; imported
+    # here so the rest of the module does not need spdx-tools
+    # pylint: disable=import-outside-toplevel
+    from spdx_tools.spdx.validation.validation_message import (
+        SpdxElementType,
+        ValidationContext,
+        ValidationMessage,
+    )
+
+    context = ValidationContext(
+        spdx_id="SPDXRef-Package",
+        parent_id="SPDXRef-Document",
+        element_type=SpdxElementType.PACKAGE,
+    )
+    msg = ValidationMessage("Test validation error", context)
+    assert get_validation_messages_text([msg], verbose=True) == (
+        "Test validation error\n"
+        "- SPDX ID: SPDXRef-Package\n"
+        "- Parent ID: SPDXRef-Document\n"
+        "- Element type: SpdxElementType.PACKAGE\n"
+    )
+
+
+def test_print_validation_messages_verbose_empty_context(
+    capsys: pytest.CaptureFixture[str], sample_msg_with_empty_context: ValidationMessage
+) -> None:
+    print_validation_messages([sample_msg_with_empty_context], verbose=True)
+    output = capsys.readouterr().out
+    missing = [n for n in EMPTY_CONTEXT_TEXT_NEEDLES if n not in output]
+    assert not missing, missing
+
+
+def test_print_validation_messages_multiple(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    messages = [
+        _message("First error"),
+        _message("Second error"),
+    ]
+    print_validation_messages(messages)
+    output = capsys.readouterr().out
+    assert output == "First error\n\nSecond error\n\n"
+
+
+# Messages without text are skipped
+empty_messages_test: list[list[ValidationMessage]] = [
+    [],
+    [_message(None)],
+    [_message("")],
+    [
+        _message(None),
+        _message(""),
+    ],
+]
+
+
+@pytest.mark.parametrize("messages", empty_messages_test)
+def test_print_validation_messages_empty(
+    capsys: pytest.CaptureFixture[str], messages: list[ValidationMessage]
+) -> None:
+    print_validation_messages(messages)
+    output = capsys.readouterr().out
+    assert output == "\n"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("test_value", "test_value"),
+        (None, "N/A"),
+        ("", "N/A"),
+        (42, "42"),
+        (0, "0"),
+        (True, "True"),
+        (False, "False"),
+    ],
+)
+def test_safe_attr(value: object, expected: str) -> None:
+    assert _safe_attr(SimpleNamespace(name=value), "name") == expected
+
+
+def test_safe_attr_missing_attribute() -> None:
+    assert _safe_attr(NO_ATTRIBUTES, "name") == "N/A"
+
+
+@pytest.fixture(scope="module", name="sample_html")
+def fixture_sample_html(sample_msg_with_context: ValidationMessage) -> str:
+    return get_validation_messages_html([sample_msg_with_context])
+
+
+@pytest.fixture(scope="module", name="sample_verbose_html")
+def fixture_sample_verbose_html(sample_msg_with_context: ValidationMessage) -> str:
+    return get_validation_messages_html([sample_msg_with_context], verbose=True)
+
+
+def test_get_validation_messages_html(sample_html: str) -> None:
+    assert sample_html == EXPECTED_HTML
+
+
+def test_get_validation_messages_html_verbose(sample_verbose_html: str) -> None:
+    assert sample_verbose_html == EXPECTED_VERBOSE_HTML
+
+
+@pytest.mark.parametrize(
+    "messages, expected",
+    [
+        ([], ""),
+        (
+            [_message(None)],
+            "<ul class='conformance-val-list'>\n</ul>",
+        ),
+        (
+            [_message("")],
+            "<ul class='conformance-val-list'>\n</ul>",
+        ),
+        (
+            [
+                _message(None),
+                _message(""),
+            ],
+            "<ul class='conformance-val-list'>\n</ul>",
+        ),
+    ],
+)
+def test_get_validation_messages_html_empty(
+    messages: list[ValidationMessage], expected: str
+) -> None:
+    assert get_validation_messages_html(messages) == expected
+
+
+def test_get_validation_messages_html_verbose_empty_context(
+    sample_msg_with_empty_context: ValidationMessage,
+) -> None:
+    result = get_validation_messages_html([sample_msg_with_empty_context], verbose=True)
+    missing = [n for n in EMPTY_CONTEXT_HTML_NEEDLES if n not in result]
+    assert not missing, missing